@@ -12,6 +12,8 @@ from warnings import warn
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
+from numba import njit, prange
 from sklearn.base import clone
 
 from sktime.datatypes import convert, convert_to
@@ -41,6 +43,12 @@ class ConformalIntervals(BaseForecaster):
         on the training set, i.e., quantiles of epsilon-h (in notation [1]_),
         at quantile point (1-coverage)/2 quantiles, as offsets to point prediction
 
+    If fh is passed in fit, residuals are computed in fit. In update, they are
+    updated only if forecaster is a NaiveForecaster with strategy "last" or "mean",
+    without seasonality, for which residuals are computed without refitting.
+    For other forecasters, the residuals computed in fit are used after update,
+    since updating them would require refitting the forecaster at every index.
+
     Parameters
     ----------
     forecaster : estimator
@@ -60,6 +68,13 @@ class ConformalIntervals(BaseForecaster):
         residuals matrix values for (for speeding up calculation)
     verbose : bool, optional, default=False
         whether to print warnings if windows with too few data points occur
+    n_jobs : int or None, optional, default=None
+        The number of jobs to run in parallel when computing the residuals matrix.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
+        ``-1`` means using all processors.
+    random_state : int, np.random.Generator or None, optional, default=None
+        seed or generator for sampling indices if sample_frac is passed,
+        passed to np.random.default_rng
 
     References
     ----------
@@ -102,6 +117,8 @@ class ConformalIntervals(BaseForecaster):
         initial_window=1,
         sample_frac=None,
         verbose=False,
+        n_jobs=None,
+        random_state=None,
     ):
 
         if not isinstance(method, str):
@@ -117,6 +134,8 @@ class ConformalIntervals(BaseForecaster):
         self.verbose = verbose
         self.initial_window = initial_window
         self.sample_frac = sample_frac
+        self.n_jobs = n_jobs
+        self.random_state = random_state
 
         super(ConformalIntervals, self).__init__()
 
@@ -133,17 +152,28 @@ class ConformalIntervals(BaseForecaster):
 
     def _fit(self, y, X=None, fh=None):
         self.fh_early_ = fh is not None
+        self._quantile_fn_, self._use_abs_ = _METHOD_DISPATCH[self.method]
+        # seeded once, so that samples drawn in fit and later updates are independent
+        self._rng_ = np.random.default_rng(self.random_state)
         self.forecaster_ = clone(self.forecaster)
         self.forecaster_.fit(y=y, X=X, fh=fh)
 
+        # sorted residuals per horizon offset, i.e., diagonal of residuals matrix,
+        # if fh is not passed in fit, residuals are computed in _predict_interval
         if self.fh_early_:
-            self.residuals_matrix_ = self._compute_sliding_residuals(
+            (
+                self._residual_diagonals_,
+                self._residuals_arr_,
+                self._residual_rows_,
+                self._residual_cols_,
+            ) = self._compute_sliding_residuals(
                 y=y,
                 X=X,
                 forecaster=self.forecaster,
                 initial_window=self.initial_window,
                 sample_frac=self.sample_frac,
             )
+            self._abs_residual_diagonals_ = _to_sorted_abs(self._residual_diagonals_)
 
         return self
 
@@ -152,6 +182,47 @@ class ConformalIntervals(BaseForecaster):
 
     def _update(self, y, X=None, update_params=True):
         self.forecaster_.update(y, X, update_params=update_params)
+
+        # residuals in closed form are cheap to update, residuals of other
+        # forecasters are kept as computed in fit, since updating them
+        # would refit the forecaster at every index
+        closed_form = _has_closed_form_residuals(self.forecaster)
+        if self.fh_early_ and update_params and closed_form:
+            y_new = convert_to(y, "pd.Series")
+            cols = self._residual_cols_
+            if len(cols) > 0 and y_new.index[0] > cols[-1]:
+                (
+                    self._residual_diagonals_,
+                    self._residuals_arr_,
+                    self._residual_rows_,
+                    self._residual_cols_,
+                ) = self._extend_sliding_residuals(
+                    residual_diagonals=self._residual_diagonals_,
+                    residuals_arr=self._residuals_arr_,
+                    residual_rows=self._residual_rows_,
+                    residual_cols=cols,
+                    y=self._y,
+                    X=self._X,
+                    forecaster=self.forecaster,
+                    initial_window=self.initial_window,
+                    sample_frac=self.sample_frac,
+                )
+            else:
+                # y revises values seen before, so residuals are recomputed
+                (
+                    self._residual_diagonals_,
+                    self._residuals_arr_,
+                    self._residual_rows_,
+                    self._residual_cols_,
+                ) = self._compute_sliding_residuals(
+                    y=self._y,
+                    X=self._X,
+                    forecaster=self.forecaster,
+                    initial_window=self.initial_window,
+                    sample_frac=self.sample_frac,
+                )
+            self._abs_residual_diagonals_ = _to_sorted_abs(self._residual_diagonals_)
+
         return self
 
     def _predict_interval(self, fh, X=None, coverage=None):
@@ -195,56 +266,117 @@ class ConformalIntervals(BaseForecaster):
         fh_relative = fh.to_relative(self.cutoff)
         fh_absolute = fh.to_absolute(self.cutoff)
 
-        if self.fh_early_:
-            residuals_matrix = self.residuals_matrix_
-        else:
-            residuals_matrix = self._compute_sliding_residuals(
-                y=self._y,
-                X=self._X,
-                forecaster=self.forecaster,
-                initial_window=self.initial_window,
-                sample_frac=self.sample_frac,
-            )
+        coverage2 = np.repeat(coverage, 2)
+        quantiles = self._quantile_fn_(coverage2, len(fh))
 
-        ABS_RESIDUAL_BASED = ["conformal", "conformal_bonferroni", "empirical_residual"]
+        use_abs = self._use_abs_
 
-        cols = pd.MultiIndex.from_product([["Coverage"], coverage, ["lower", "upper"]])
-        pred_int = pd.DataFrame(index=fh_absolute, columns=cols)
-        for fh_ind, offset in zip(fh_absolute, fh_relative):
-            resids = np.diagonal(residuals_matrix, offset=offset)
-            resids = resids[~np.isnan(resids)]
-            abs_resids = np.abs(resids)
-            coverage2 = np.repeat(coverage, 2)
-            if self.method == "empirical":
-                quantiles = 0.5 + np.tile([-0.5, 0.5], len(coverage)) * coverage2
-                pred_int_row = np.quantile(resids, quantiles)
-            if self.method == "empirical_residual":
-                quantiles = 0.5 - 0.5 * coverage2
-                pred_int_row = np.quantile(abs_resids, quantiles)
-            elif self.method == "conformal_bonferroni":
-                alphas = 1 - coverage2
-                quantiles = 1 - alphas / len(fh)
-                pred_int_row = np.quantile(abs_resids, quantiles)
-            elif self.method == "conformal":
-                quantiles = coverage2
-                pred_int_row = np.quantile(abs_resids, quantiles)
-
-            pred_int.loc[fh_ind] = pred_int_row
+        # absolute residual based intervals at coverage 0 have zero width,
+        # residuals need not be looked at if all coverages are 0
+        if use_abs and np.all(coverage2 == 0):
+            pred_int_arr = np.zeros((len(fh_relative), len(quantiles)))
+        else:
+            pred_int_arr = self._get_residual_quantiles(fh_relative, quantiles)
+            if use_abs:
+                pred_int_arr[:, coverage2 == 0] = 0
 
         y_pred = self.predict(fh=fh, X=X)
         y_pred = convert(y_pred, from_type=self._y_mtype_last_seen, to_type="pd.Series")
-        y_pred.index = fh_absolute
 
-        for col in cols:
-            if self.method in ABS_RESIDUAL_BASED:
-                sign = 1 - 2 * (col[2] == "lower")
+        cols = pd.MultiIndex.from_product([["Coverage"], coverage, ["lower", "upper"]])
+
+        # absolute residuals are subtracted for lower, added for upper bounds,
+        # signed residuals are added for both
+        if use_abs:
+            signs = np.where(cols.get_level_values(2) == "lower", -1.0, 1.0)
+            pred_int_arr = signs * pred_int_arr
+        pred_int_arr = y_pred.to_numpy(dtype="float")[:, None] + pred_int_arr
+
+        pred_int = pd.DataFrame(pred_int_arr, index=fh_absolute, columns=cols)
+
+        return pred_int
+
+    @property
+    def residuals_matrix_(self):
+        """Sliding residuals matrix, available if fh was passed in fit.
+
+        The matrix is not stored, it is a dense view of the residuals kept in fit,
+        which are stored only from the diagonal onwards in every row.
+
+        Returns
+        -------
+        residuals_matrix : pd.DataFrame of float32
+            row index are indices at which y is split, sampled if sample_frac is
+            passed, column index = y.index[initial_window:], as seen in fit/update.
+            [i,j]-th entry is signed residual of forecasting y.loc[j] from y.loc[:i],
+            using a clone of the forecaster passed through the forecaster arg.
+            Entries are float32, unlike the float64 of NaiveVariance.residuals_matrix_
+        """
+        if not getattr(self, "fh_early_", False):
+            raise AttributeError(
+                "residuals_matrix_ is only available if fh was passed in fit"
+            )
+
+        rows = self._residual_rows_
+        cols = self._residual_cols_
+        _, col_start, row_starts = _ragged_layout(cols, rows, cols)
+        residuals_arr = _ragged_to_dense(
+            self._residuals_arr_, col_start, row_starts, len(cols)
+        )
+
+        return pd.DataFrame(residuals_arr, index=rows, columns=cols)
+
+    def _get_residual_quantiles(self, offsets, quantiles):
+        """Return quantiles of residuals at horizon offsets.
+
+        Parameters
+        ----------
+        offsets : iterable of int
+            relative horizon offsets, i.e., diagonal offsets in the residuals matrix
+        quantiles : 1D np.ndarray of float, in [0, 1] interval
+
+        Returns
+        -------
+        2D np.ndarray of shape (len(offsets), len(quantiles))
+            [i, j]-th entry is quantiles[j] quantile of residuals at offsets[i],
+            of absolute residuals if method is based on absolute residuals
+        """
+        empty = np.empty(0, dtype=np.float32)
+
+        if self.fh_early_:
+            if self._use_abs_:
+                residual_diagonals = self._abs_residual_diagonals_
             else:
-                sign = 1
-            pred_int[col] = y_pred + sign * pred_int[col]
+                residual_diagonals = self._residual_diagonals_
+            pred_int_rows = [
+                _quantile_from_sorted(residual_diagonals.get(ofs, empty), quantiles)
+                for ofs in offsets
+            ]
+            return np.vstack(pred_int_rows)
 
-        return pred_int.convert_dtypes()
+        # fh was not passed in fit, so residuals are computed at every call,
+        # sampled from a fresh generator, so that predict does not change state
+        residual_diagonals, _, _, _ = self._compute_sliding_residuals(
+            y=self._y,
+            X=self._X,
+            forecaster=self.forecaster,
+            initial_window=self.initial_window,
+            sample_frac=self.sample_frac,
+            rng=np.random.default_rng(self.random_state),
+        )
+        residuals = [residual_diagonals.get(ofs, empty) for ofs in offsets]
+        if self._use_abs_:
+            # absolute residuals are used once, one partition is cheaper than sorting
+            pred_int_rows = [
+                _quantile_from_partition(np.abs(x), quantiles) for x in residuals
+            ]
+        else:
+            pred_int_rows = [_quantile_from_sorted(x, quantiles) for x in residuals]
+        return np.vstack(pred_int_rows)
 
-    def _compute_sliding_residuals(self, y, X, forecaster, initial_window, sample_frac):
+    def _compute_sliding_residuals(
+        self, y, X, forecaster, initial_window, sample_frac, rng=None
+    ):
         """Compute sliding residuals used in uncertainty estimates.
 
         Parameters
@@ -261,48 +393,182 @@ class ConformalIntervals(BaseForecaster):
             for speeding up computing of residuals matrix.
             sample value in range (0, 1) to obtain a fraction of y indices to
             compute residuals matrix for
+        rng : np.random.Generator, optional, default=self._rng_
+            generator to sample indices from, if sample_frac is passed
+
         Returns
         -------
-        residuals_matrix : pd.DataFrame, row and column index = y.index[initial_window:]
-            [i,j]-th entry is signed residual of forecasting y.loc[j] from y.loc[:i],
-            using a clone of the forecaster passed through the forecaster arg.
-            if sample_frac is passed this will have NaN values for 1 - sample_frac
-            fraction of the matrix
+        residual_diagonals : dict of int to 1D np.ndarray of float32
+            as returned by _to_sorted_diagonals, sorted non-NaN residuals per offset,
+            i.e., per diagonal of the residuals matrix, see residuals_matrix_
+        residuals_arr : 1D np.ndarray of float32
+            residuals matrix rows, in the layout returned by _ragged_layout
+        residual_rows : pd.Index
+            y.index[initial_window:], or sorted sample of it of fraction sample_frac,
+            if sample_frac is passed, rows of the residuals matrix
+        residual_cols : pd.Index
+            y.index[initial_window:], columns of the residuals matrix
         """
         y = convert_to(y, "pd.Series")
 
         y_index = y.index[initial_window:]
+        full_index = y_index
+
+        if sample_frac:
+            if rng is None:
+                rng = self._rng_
+            y_index = _sample_index(y_index, sample_frac, rng)
+
+        residuals_arr = self._get_ragged_residuals(
+            y=y, X=X, forecaster=forecaster, y_index=y_index, full_index=full_index
+        )
+        residual_diagonals = _to_sorted_diagonals(
+            residuals_arr,
+            *_ragged_layout(y.index, y_index, full_index),
+            len(full_index),
+        )
 
-        residuals_matrix = pd.DataFrame(columns=y_index, index=y_index, dtype="float")
+        return residual_diagonals, residuals_arr, y_index, full_index
+
+    def _get_ragged_residuals(self, y, X, forecaster, y_index, full_index):
+        """Compute rows of the residuals matrix, without entries left of the diagonal.
+
+        Parameters
+        ----------
+        y : pd.Series
+            time series to use in computing residuals matrix
+        X : pd.DataFrame or None
+            exogeneous time series to use in forecasts
+        forecaster : sktime compatible forecaster
+            forecaster to use in computing the sliding residuals
+        y_index : pd.Index, sorted subset of y.index
+            indices at which y is split, rows of the residuals matrix
+        full_index : pd.Index, tail of y.index
+            columns of the residuals matrix
 
+        Returns
+        -------
+        residuals_arr : 1D np.ndarray of float32
+            residuals matrix rows, in the layout returned by _ragged_layout
+        """
+        if _has_closed_form_residuals(forecaster):
+            # residuals of simple naive strategies are obtained without refitting
+            return _get_naive_residuals_arr(forecaster, y, y_index, full_index)
+        return self._get_residuals_arr(
+            y=y, X=X, forecaster=forecaster, y_index=y_index, full_index=full_index
+        )
+
+    def _extend_sliding_residuals(
+        self,
+        residual_diagonals,
+        residuals_arr,
+        residual_rows,
+        residual_cols,
+        y,
+        X,
+        forecaster,
+        initial_window,
+        sample_frac,
+    ):
+        """Extend sliding residuals to indices of y not yet seen.
+
+        Only residuals at new indices of y are computed, existing entries are reused.
+        Assumes that y extends the data the residuals were computed on, at the end.
+        Used in update only if _has_closed_form_residuals is True for forecaster.
+
+        Parameters
+        ----------
+        residual_diagonals, residuals_arr, residual_rows, residual_cols :
+            as returned by _compute_sliding_residuals,
+            on a y which is a prefix of y passed here
+        y, X, forecaster, initial_window, sample_frac :
+            as in _compute_sliding_residuals
+
+        Returns
+        -------
+        residual_diagonals, residuals_arr, residual_rows, residual_cols :
+            as returned by _compute_sliding_residuals on y,
+            except for sampling, if sample_frac is passed, existing rows are kept
+        """
+        y = convert_to(y, "pd.Series")
+
+        full_index = y.index[initial_window:]
+        n_old_cols = len(residual_cols)
+        new_cols = full_index[n_old_cols:]
+
+        if len(new_cols) == 0:
+            return residual_diagonals, residuals_arr, residual_rows, residual_cols
+
+        new_rows = new_cols
         if sample_frac:
-            y_index = y_index.to_series().sample(frac=sample_frac)
-
-        for id in y_index:
-            forecaster = clone(forecaster)
-            y_train = get_slice(y, start=None, end=id)  # subset on which we fit
-            y_test = get_slice(y, start=id, end=None)  # subset on which we predict
-
-            X_train = get_slice(X, start=None, end=id)
-            X_test = get_slice(X, start=id, end=None)
-
-            try:
-                forecaster.fit(y_train, X=X_train, fh=y_test.index)
-            except ValueError:
-                warn(
-                    f"Couldn't fit the model on "
-                    f"time series window length {len(y_train)}.\n"
-                )
+            new_rows = _sample_index(new_rows, sample_frac, self._rng_)
+        y_index = residual_rows.append(new_rows)
+
+        # new rows have non-NaN entries only in new columns,
+        # so only the new columns need to be computed, for all rows
+        new_arr = self._get_ragged_residuals(
+            y=y, X=X, forecaster=forecaster, y_index=y_index, full_index=new_cols
+        )
+        new_layout = _ragged_layout(y.index, y_index, new_cols)
+        new_diagonals = _to_sorted_diagonals(new_arr, *new_layout, len(full_index))
+
+        # old rows are continued by their entries at new columns, then new rows
+        _, _, row_starts = _ragged_layout(residual_cols, residual_rows, residual_cols)
+        residuals_arr = _ragged_append(
+            residuals_arr, row_starts, new_arr, new_layout[2]
+        )
+
+        residual_diagonals = residual_diagonals.copy()
+        for ofs, new_resids in new_diagonals.items():
+            if ofs in residual_diagonals:
+                resids = np.concatenate([residual_diagonals[ofs], new_resids])
+                residual_diagonals[ofs] = np.sort(resids)
+            else:
+                residual_diagonals[ofs] = new_resids
+
+        return residual_diagonals, residuals_arr, y_index, full_index
+
+    def _get_residuals_arr(self, y, X, forecaster, y_index, full_index):
+        """Compute sliding residuals by fitting the forecaster on every window.
+
+        Parameters
+        ----------
+        y : pd.Series
+            time series to use in computing residuals matrix
+        X : pd.DataFrame or None
+            exogeneous time series to use in forecasts
+        forecaster : sktime compatible forecaster
+            forecaster to use in computing the sliding residuals
+        y_index : pd.Index, sorted subset of y.index
+            indices at which y is split, rows of the residuals matrix
+        full_index : pd.Index, tail of y.index
+            columns of the residuals matrix
+
+        Returns
+        -------
+        residuals_arr : 1D np.ndarray of float32
+            residuals matrix rows, in the layout returned by _ragged_layout
+        """
+        # y and X are passed unchanged to every task, so joblib can memmap their
+        # underlying arrays once instead of pickling a window copy per task
+        all_residuals = Parallel(n_jobs=self.n_jobs, batch_size="auto")(
+            delayed(_get_residuals_matrix_row)(forecaster, y, X, id) for id in y_index
+        )
+
+        # fill a preallocated array by position, entries left of the diagonal are
+        # never forecast, so rows are stored from their split index onwards only
+        # float32 suffices for empirical quantiles, and halves memory traffic
+        _, col_start, row_starts = _ragged_layout(y.index, y_index, full_index)
+        residuals_arr = np.full(row_starts[-1], np.nan, dtype=np.float32)
+        for row_i, residuals in enumerate(all_residuals):
+            if residuals is None:
                 continue
-            try:
-                residuals_matrix.loc[id] = forecaster.predict_residuals(y_test, X_test)
-            except IndexError:
-                warn(
-                    f"Couldn't predict after fitting on time series of length \
-                     {len(y_train)}.\n"
-                )
+            col_js = full_index.get_indexer(residuals.index)
+            in_row = col_js >= col_start[row_i]
+            pos = row_starts[row_i] + col_js[in_row] - col_start[row_i]
+            residuals_arr[pos] = residuals.to_numpy()[in_row]
 
-        return residuals_matrix
+        return residuals_arr
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -320,7 +586,449 @@ class ConformalIntervals(BaseForecaster):
         """
         from sktime.forecasting.naive import NaiveForecaster
 
-        FORECASTER = NaiveForecaster()
-        params_list = {"forecaster": FORECASTER}
+        # the default NaiveForecaster has closed form residuals,
+        # "drift" is not in closed form, so covers residuals from refitting
+        params_list = [
+            {"forecaster": NaiveForecaster()},
+            {"forecaster": NaiveForecaster(strategy="drift")},
+            {
+                "forecaster": NaiveForecaster(strategy="drift"),
+                "method": "conformal_bonferroni",
+                "sample_frac": 0.5,
+                "random_state": 42,
+            },
+        ]
 
         return params_list
+
+
+def _empirical_quantiles(coverage2, fh_len):
+    """Quantiles of signed residuals for lower/upper ends, method="empirical"."""
+    return 0.5 + np.tile([-0.5, 0.5], len(coverage2) // 2) * coverage2
+
+
+def _empirical_residual_quantiles(coverage2, fh_len):
+    """Quantiles of absolute residuals, method="empirical_residual"."""
+    return 0.5 - 0.5 * coverage2
+
+
+def _conformal_bonferroni_quantiles(coverage2, fh_len):
+    """Quantiles of absolute residuals, method="conformal_bonferroni"."""
+    alphas = 1 - coverage2
+    return np.clip(1 - alphas / fh_len, 0.0, 1.0)
+
+
+def _conformal_quantiles(coverage2, fh_len):
+    """Quantiles of absolute residuals, method="conformal"."""
+    return coverage2
+
+
+# (quantile_fn, use_abs) per method, bound to the method in fit
+#   quantile_fn is a function (coverage2, fh_len) -> quantiles, where
+#     coverage2 are the coverages, each repeated twice, for lower/upper interval end
+#     fh_len is the number of indices in the forecasting horizon
+#     quantiles are of residuals, with same length as coverage2
+#   use_abs is whether quantiles are of absolute residuals, or of signed residuals
+_METHOD_DISPATCH = {
+    "empirical": (_empirical_quantiles, False),
+    "empirical_residual": (_empirical_residual_quantiles, True),
+    "conformal_bonferroni": (_conformal_bonferroni_quantiles, True),
+    "conformal": (_conformal_quantiles, True),
+}
+
+
+def _get_residuals_matrix_row(forecaster, y, X, id):
+    """Compute one row of the sliding residuals matrix.
+
+    Parameters
+    ----------
+    forecaster : sktime compatible forecaster
+        forecaster to use in computing the residuals, is cloned before fitting
+    y : pd.Series
+        time series to use in computing residuals matrix
+    X : pd.DataFrame or None
+        exogeneous time series to use in forecasts
+    id : element of y.index
+        index at which y is split, fit is on y before id, predict on y from id
+
+    Returns
+    -------
+    residuals : pd.Series of float32, or None
+        signed residuals of forecasting y.loc[id:] from y before id,
+        None if the forecaster could not be fitted or could not predict
+    """
+    forecaster = clone(forecaster)
+    y_train = get_slice(y, start=None, end=id)  # subset on which we fit
+    y_test = get_slice(y, start=id, end=None)  # subset on which we predict
+
+    X_train = get_slice(X, start=None, end=id)
+    X_test = get_slice(X, start=id, end=None)
+
+    try:
+        forecaster.fit(y_train, X=X_train, fh=y_test.index)
+    except ValueError:
+        warn(f"Couldn't fit the model on time series window length {len(y_train)}.\n")
+        return None
+    try:
+        residuals = forecaster.predict_residuals(y_test, X_test)
+        return residuals.astype(np.float32, copy=False)
+    except IndexError:
+        warn(
+            f"Couldn't predict after fitting on time series of length \
+             {len(y_train)}.\n"
+        )
+        return None
+
+
+def _sample_index(index, sample_frac, rng):
+    """Sample a fraction of an index, without replacement.
+
+    Parameters
+    ----------
+    index : pd.Index
+    sample_frac : float in (0, 1)
+        fraction of index to sample
+    rng : np.random.Generator
+        generator to draw the sample from
+
+    Returns
+    -------
+    pd.Index, sorted random subset of index of fraction sample_frac
+    """
+    n = len(index)
+    pos = rng.choice(n, size=int(round(sample_frac * n)), replace=False)
+    return index[np.sort(pos)]
+
+
+def _has_closed_form_residuals(forecaster):
+    """Check whether sliding residuals of forecaster can be computed in closed form.
+
+    Parameters
+    ----------
+    forecaster : sktime compatible forecaster
+
+    Returns
+    -------
+    bool, True if forecaster is a NaiveForecaster with strategy "last" or "mean",
+        without seasonality and without window_length, False otherwise
+    """
+    from sktime.forecasting.naive import NaiveForecaster
+
+    if type(forecaster) is not NaiveForecaster:
+        return False
+    strategy_ok = forecaster.strategy in ("last", "mean")
+    sp_ok = (forecaster.sp or 1) == 1
+    return strategy_ok and sp_ok and forecaster.window_length is None
+
+
+def _get_naive_residuals_arr(forecaster, y, y_index, full_index):
+    """Compute sliding residuals of NaiveForecaster in closed form.
+
+    Equivalent to fitting forecaster on y before each index in y_index,
+    and computing residuals at full_index from that index onwards,
+    for forecaster where _has_closed_form_residuals is True.
+
+    Parameters
+    ----------
+    forecaster : NaiveForecaster with strategy "last" or "mean", sp=1
+    y : pd.Series
+        time series to use in computing residuals matrix
+    y_index : pd.Index, sorted subset of y.index
+        indices at which y is split, rows of the residuals matrix
+    full_index : pd.Index, tail of y.index
+        columns of the residuals matrix
+
+    Returns
+    -------
+    residuals_arr : 1D np.ndarray of float32
+        residuals matrix rows, in the layout returned by _ragged_layout
+    """
+    y_vals = y.to_numpy(dtype=np.float64)
+    split_pos = y.index.get_indexer(y_index)
+    first_col = len(y) - len(full_index)
+
+    # point forecast after training on y_vals[:i] is at entry i - 1,
+    # both strategies ignore NaN, as NaiveForecaster does
+    not_nan = ~np.isnan(y_vals)
+    if forecaster.strategy == "last":
+        y_pred = pd.Series(y_vals).ffill().to_numpy()
+    else:
+        with np.errstate(invalid="ignore"):
+            y_pred = np.cumsum(np.where(not_nan, y_vals, 0)) / np.cumsum(not_nan)
+    y_pred = np.concatenate([[np.nan], y_pred])[split_pos]
+
+    # the point forecast is the same for all indices from the split index onwards
+    _, col_start, row_starts = _ragged_layout(y.index, y_index, full_index)
+    residuals_arr = np.empty(row_starts[-1], dtype=np.float32)
+    for row_i in range(len(y_index)):
+        y_test = y_vals[first_col + col_start[row_i] :]
+        residuals_arr[row_starts[row_i] : row_starts[row_i + 1]] = (
+            y_test - y_pred[row_i]
+        )
+
+    return residuals_arr
+
+
+def _ragged_layout(index, y_index, full_index):
+    """Return layout of residuals matrix rows, without entries left of the diagonal.
+
+    Row i of the residuals matrix can be non-NaN only from the column of its split
+    index onwards, so its entries are stored from that column onwards only,
+    all rows concatenated in one 1D array.
+
+    Parameters
+    ----------
+    index : pd.Index
+        index of the time series the residuals are computed on
+    y_index : pd.Index, sorted subset of index
+        indices at which the time series is split, rows of the residuals matrix
+    full_index : pd.Index, tail of index
+        columns of the residuals matrix
+
+    Returns
+    -------
+    row_pos : 1D np.ndarray of int64, of length len(y_index)
+        column position of the split index of the i-th row,
+        negative if the split index is left of the first column
+    col_start : 1D np.ndarray of int64, of length len(y_index)
+        column position of the first stored entry of the i-th row, i.e.,
+        row_pos clipped to [0, len(full_index)]
+    row_starts : 1D np.ndarray of int64, of length len(y_index) + 1
+        entries of the i-th row, at columns col_start[i] onwards, are at
+        row_starts[i]:row_starts[i + 1] in the 1D array, its length at the end
+    """
+    n_cols = len(full_index)
+    row_pos = index.get_indexer(y_index).astype(np.int64) - (len(index) - n_cols)
+    col_start = np.clip(row_pos, 0, n_cols)
+    row_starts = np.zeros(len(row_pos) + 1, dtype=np.int64)
+    row_starts[1:] = np.cumsum(n_cols - col_start)
+    return row_pos, col_start, row_starts
+
+
+def _ragged_to_dense(residuals_arr, col_start, row_starts, n_cols):
+    """Convert residuals matrix rows in layout of _ragged_layout to a 2D array.
+
+    Parameters
+    ----------
+    residuals_arr : 1D np.ndarray of float32
+        residuals matrix rows, in the layout returned by _ragged_layout
+    col_start, row_starts : 1D np.ndarray of int64
+        as returned by _ragged_layout
+    n_cols : int
+        number of columns of the residuals matrix
+
+    Returns
+    -------
+    2D np.ndarray of float32, of shape (len(col_start), n_cols)
+        residuals matrix, NaN left of the diagonal
+    """
+    dense = np.full((len(col_start), n_cols), np.nan, dtype=np.float32)
+    for row_i, col_j in enumerate(col_start):
+        dense[row_i, col_j:] = residuals_arr[row_starts[row_i] : row_starts[row_i + 1]]
+    return dense
+
+
+def _ragged_append(residuals_arr, row_starts, new_arr, new_row_starts):
+    """Append columns to residuals matrix rows in layout of _ragged_layout.
+
+    Parameters
+    ----------
+    residuals_arr : 1D np.ndarray of float32
+        residuals matrix rows, in the layout returned by _ragged_layout
+    row_starts : 1D np.ndarray of int64
+        as returned by _ragged_layout, for residuals_arr
+    new_arr : 1D np.ndarray of float32
+        residuals matrix rows at new columns, in the layout of _ragged_layout,
+        the rows of residuals_arr first, followed by new rows
+    new_row_starts : 1D np.ndarray of int64
+        as returned by _ragged_layout, for new_arr
+
+    Returns
+    -------
+    1D np.ndarray of float32
+        residuals matrix rows at all columns, in the layout of _ragged_layout
+    """
+    n_rows = len(row_starts) - 1
+    pieces = []
+    for row_i in range(n_rows):
+        pieces.append(residuals_arr[row_starts[row_i] : row_starts[row_i + 1]])
+        pieces.append(new_arr[new_row_starts[row_i] : new_row_starts[row_i + 1]])
+    pieces.append(new_arr[new_row_starts[n_rows] :])
+    return np.concatenate(pieces)
+
+
+def _to_sorted_diagonals(residuals_arr, row_pos, col_start, row_starts, n_offsets):
+    """Convert residuals matrix rows to sorted, NaN-free residuals per diagonal offset.
+
+    Parameters
+    ----------
+    residuals_arr : 1D np.ndarray of float32
+        residuals matrix rows, in the layout returned by _ragged_layout
+    row_pos, col_start, row_starts : 1D np.ndarray of int64
+        as returned by _ragged_layout
+    n_offsets : int
+        diagonals at offsets 0, ..., n_offsets - 1 are extracted
+
+    Returns
+    -------
+    residual_diagonals : dict of int to 1D np.ndarray of float32
+        keys are offsets with at least one non-NaN entry on the diagonal,
+        values are sorted non-NaN entries on the diagonal at that offset,
+        i.e., at [i, j] of the residuals matrix with j = row_pos[i] + offset
+    """
+    sorted_resids, starts = _sorted_diagonals(
+        np.asarray(residuals_arr, dtype=np.float32),
+        row_starts,
+        col_start - row_pos,
+        n_offsets,
+    )
+
+    # all diagonals share the memory of sorted_resids, each is a contiguous slice
+    residual_diagonals = {
+        ofs: sorted_resids[starts[ofs] : starts[ofs + 1]]
+        for ofs in range(n_offsets)
+        if starts[ofs + 1] > starts[ofs]
+    }
+    return residual_diagonals
+
+
+@njit(parallel=True, cache=True)
+def _sorted_diagonals(residuals_arr, row_starts, row_ofs, n_offsets):
+    """Extract sorted, NaN-free residuals on diagonals of residuals matrix.
+
+    Parameters
+    ----------
+    residuals_arr : 1D np.ndarray of float
+        residuals matrix rows, concatenated, NaN entries are ignored
+    row_starts : 1D np.ndarray of int64, of length m + 1
+        entries of the i-th row are residuals_arr[row_starts[i]:row_starts[i + 1]]
+    row_ofs : 1D np.ndarray of int64, of length m
+        diagonal offset of the first entry of the i-th row,
+        offsets of further entries of the row increase by one
+    n_offsets : int
+        diagonals at offsets 0, ..., n_offsets - 1 are extracted
+
+    Returns
+    -------
+    sorted_resids : 1D np.ndarray of same dtype as residuals_arr
+        sorted non-NaN entries of the h-th diagonal are
+        sorted_resids[starts[h]:starts[h + 1]], for all h
+    starts : 1D np.ndarray of int64, of length n_offsets + 1
+        start positions of diagonals in sorted_resids, and its length at the end
+    """
+    m = len(row_ofs)
+
+    # first pass: count non-NaN entries per diagonal, to allocate output exactly
+    lengths = np.zeros(n_offsets, dtype=np.int64)
+    for h in prange(n_offsets):
+        for i in range(m):
+            k = row_starts[i] + h - row_ofs[i]
+            if k >= row_starts[i] and k < row_starts[i + 1]:
+                if not np.isnan(residuals_arr[k]):
+                    lengths[h] += 1
+
+    starts = np.zeros(n_offsets + 1, dtype=np.int64)
+    starts[1:] = np.cumsum(lengths)
+    sorted_resids = np.empty(starts[-1], dtype=residuals_arr.dtype)
+
+    # second pass: copy non-NaN entries per diagonal, and sort
+    for h in prange(n_offsets):
+        pos = starts[h]
+        for i in range(m):
+            k = row_starts[i] + h - row_ofs[i]
+            if k >= row_starts[i] and k < row_starts[i + 1]:
+                if not np.isnan(residuals_arr[k]):
+                    sorted_resids[pos] = residuals_arr[k]
+                    pos += 1
+        sorted_resids[starts[h] : starts[h + 1]] = np.sort(
+            sorted_resids[starts[h] : starts[h + 1]]
+        )
+
+    return sorted_resids, starts
+
+
+def _to_sorted_abs(residual_diagonals):
+    """Return sorted absolute residuals per offset, from sorted signed residuals.
+
+    Parameters
+    ----------
+    residual_diagonals : dict of int to 1D np.ndarray
+        as returned by _to_sorted_diagonals, sorted residuals per offset
+
+    Returns
+    -------
+    dict of int to 1D np.ndarray, same keys as residual_diagonals
+        sorted absolute values of residual_diagonals, per offset
+    """
+    return {ofs: _sorted_abs(x) for ofs, x in residual_diagonals.items()}
+
+
+def _sorted_abs(sorted_arr):
+    """Sort absolute values of a sorted array, by merging its negative and other part.
+
+    Parameters
+    ----------
+    sorted_arr : 1D np.ndarray, sorted in ascending order, without NaN
+
+    Returns
+    -------
+    1D np.ndarray, equal to np.sort(np.abs(sorted_arr))
+    """
+    split = np.searchsorted(sorted_arr, 0)
+    neg = -sorted_arr[:split][::-1]
+    pos = sorted_arr[split:]
+
+    # both parts are sorted, so merge positions are found by binary search
+    sorted_abs = np.empty_like(sorted_arr)
+    sorted_abs[np.arange(len(neg)) + np.searchsorted(pos, neg)] = neg
+    sorted_abs[np.arange(len(pos)) + np.searchsorted(neg, pos, side="right")] = pos
+    return sorted_abs
+
+
+def _quantile_from_partition(arr, quantiles):
+    """Compute quantiles of an array, by linear interpolation, with one partition.
+
+    Equivalent to np.quantile(arr, quantiles) with default interpolation,
+    but partitions arr once for all quantiles, at the entries required.
+
+    Parameters
+    ----------
+    arr : 1D np.ndarray, without NaN
+    quantiles : 1D np.ndarray of float, in [0, 1] interval
+
+    Returns
+    -------
+    1D np.ndarray of same length as quantiles, quantiles of arr
+        all entries are NaN if arr is empty
+    """
+    n = len(arr)
+    if n == 0:
+        return np.full(len(quantiles), np.nan)
+    pos = np.asarray(quantiles, dtype="float") * (n - 1)
+    lo = np.floor(pos).astype(int)
+    hi = np.minimum(lo + 1, n - 1)
+    part = np.partition(arr, np.unique(np.concatenate([lo, hi])))
+    frac = pos - lo
+    return part[lo] * (1 - frac) + part[hi] * frac
+
+
+def _quantile_from_sorted(sorted_arr, quantiles):
+    """Compute quantiles of a sorted array, by linear interpolation.
+
+    Equivalent to np.quantile(sorted_arr, quantiles) with default interpolation,
+    but avoids the partition of the array, since sorted_arr is already sorted.
+
+    Parameters
+    ----------
+    sorted_arr : 1D np.ndarray, sorted in ascending order, without NaN
+    quantiles : 1D np.ndarray of float, in [0, 1] interval
+
+    Returns
+    -------
+    1D np.ndarray of same length as quantiles, quantiles of sorted_arr
+        all entries are NaN if sorted_arr is empty
+    """
+    n = len(sorted_arr)
+    if n == 0:
+        return np.full(len(quantiles), np.nan)
+    return np.interp(quantiles, np.linspace(0, 1, n), sorted_arr)
@@ -4,12 +4,17 @@
 
 __author__ = ["fkiraly"]
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from sktime.datasets import load_airline
 from sktime.datatypes import MTYPE_LIST_SERIES, convert_to
-from sktime.forecasting.conformal import ConformalIntervals
+from sktime.forecasting.conformal import (
+    ConformalIntervals,
+    _get_naive_residuals_arr,
+    _sorted_abs,
+)
 from sktime.forecasting.naive import NaiveForecaster, NaiveVariance
 
 INTERVAL_WRAPPERS = [ConformalIntervals, NaiveVariance]
@@ -50,3 +55,136 @@ def test_wrapper_series_mtype(wrapper, override_y_mtype, mtype):
 
     assert isinstance(pred_var, pd.DataFrame)
     assert len(pred_var) == 3
+
+
+@pytest.mark.parametrize(
+    "method", ["empirical_residual", "conformal", "conformal_bonferroni"]
+)
+def test_conformal_median_is_point_forecast(method):
+    """Test that absolute residual based intervals have zero width at coverage 0.
+
+    Coverage 0 is what predict_quantiles uses internally for alpha=0.5,
+    so the median must coincide with the point forecast.
+    """
+    y = load_airline()
+
+    f = ConformalIntervals(NaiveForecaster(), method=method)
+    f.fit(y, fh=[1, 2, 3])
+    y_pred = f.predict()
+    pred_median = f.predict_quantiles(alpha=0.5)
+
+    np.testing.assert_allclose(pred_median.iloc[:, 0].astype(float), y_pred)
+
+
+@pytest.mark.parametrize("strategy", ["last", "mean"])
+def test_conformal_naive_residuals_closed_form(strategy):
+    """Test that closed form NaiveForecaster residuals agree with refitting."""
+    y = load_airline().iloc[:30]
+    y_index = y.index[1:]
+    f = NaiveForecaster(strategy=strategy)
+    conformal = ConformalIntervals(f)
+
+    closed_form = _get_naive_residuals_arr(f, y, y_index, y_index)
+    refit = conformal._get_residuals_arr(
+        y=y, X=None, forecaster=f, y_index=y_index, full_index=y_index
+    )
+
+    np.testing.assert_allclose(closed_form, refit, rtol=1e-6)
+
+
+def test_conformal_sorted_abs():
+    """Test that merging sorted signed residuals sorts absolute residuals."""
+    rng = np.random.default_rng(42)
+    sorted_arr = np.sort(np.round(rng.normal(size=50), 1)).astype(np.float32)
+
+    np.testing.assert_array_equal(_sorted_abs(sorted_arr), np.sort(np.abs(sorted_arr)))
+
+
+def test_conformal_update_extends_residuals():
+    """Test that update extends the residuals as if computed from scratch."""
+    y = load_airline()
+    f = ConformalIntervals(NaiveForecaster(strategy="mean"))
+
+    f.fit(y.iloc[:30], fh=[1, 2, 3])
+    f.update(y.iloc[30:40])
+    expected, expected_arr, _, _ = f._compute_sliding_residuals(
+        y=y.iloc[:40],
+        X=None,
+        forecaster=f.forecaster,
+        initial_window=1,
+        sample_frac=None,
+    )
+
+    assert f._residual_diagonals_.keys() == expected.keys()
+    for offset, resids in expected.items():
+        np.testing.assert_array_equal(f._residual_diagonals_[offset], resids)
+    np.testing.assert_array_equal(f._residuals_arr_, expected_arr)
+
+
+def test_conformal_update_revised_values():
+    """Test that update with revised values gives the same intervals as fit."""
+    y = load_airline()
+    f = ConformalIntervals(NaiveForecaster(strategy="mean"))
+
+    f.fit(y.iloc[:30], fh=[1, 2, 3])
+    f.update(2 * y.iloc[20:40])
+    f_refit = ConformalIntervals(NaiveForecaster(strategy="mean"))
+    f_refit.fit(f._y, fh=[1, 2, 3])
+
+    pd.testing.assert_frame_equal(f.predict_interval(), f_refit.predict_interval())
+
+
+def test_conformal_update_keeps_residuals_without_closed_form():
+    """Test that update does not refit residuals of forecasters not in closed form."""
+    y = load_airline()
+    f = ConformalIntervals(NaiveForecaster(strategy="drift"))
+
+    f.fit(y.iloc[:30], fh=[1, 2, 3])
+    residual_diagonals = f._residual_diagonals_
+    f.update(y.iloc[30:40])
+
+    assert f._residual_diagonals_ is residual_diagonals
+
+
+def test_conformal_residuals_matrix_agrees_with_naive_variance():
+    """Test that residuals_matrix_ agrees with the one of NaiveVariance."""
+    y = load_airline().iloc[:30]
+    f = NaiveForecaster(strategy="drift")
+
+    conformal = ConformalIntervals(f).fit(y, fh=[1, 2, 3])
+    naive_variance = NaiveVariance(f).fit(y, fh=[1, 2, 3])
+
+    np.testing.assert_allclose(
+        conformal.residuals_matrix_.to_numpy(),
+        naive_variance.residuals_matrix_.to_numpy(dtype="float"),
+        rtol=1e-6,
+    )
+
+
+def test_conformal_sample_frac_random_state():
+    """Test that sampling in ConformalIntervals is reproducible with random_state."""
+    y = load_airline()
+
+    pred_ints = []
+    for _ in range(2):
+        f = ConformalIntervals(NaiveForecaster(), sample_frac=0.5, random_state=42)
+        f.fit(y, fh=[1, 2, 3])
+        pred_ints.append(f.predict_interval())
+
+    pd.testing.assert_frame_equal(pred_ints[0], pred_ints[1])
+
+
+def test_conformal_sample_frac_update_samples_independently():
+    """Test that updates of same length do not sample the same relative indices."""
+    y = load_airline()
+    f = ConformalIntervals(NaiveForecaster(), sample_frac=0.5, random_state=42)
+    f.fit(y.iloc[:30], fh=[1, 2, 3])
+
+    sampled_pos = []
+    for start in [30, 50]:
+        n_rows = len(f._residual_rows_)
+        f.update(y.iloc[start : start + 20])
+        new_rows = f._residual_rows_[n_rows:]
+        sampled_pos.append(y.index.get_indexer(new_rows) - start)
+
+    assert not np.array_equal(sampled_pos[0], sampled_pos[1])
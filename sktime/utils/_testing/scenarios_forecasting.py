@@ -14,13 +14,13 @@ __all__ = [
 
 
 from copy import deepcopy
+from functools import lru_cache
 from inspect import isclass
 
 import pandas as pd
 
 from sktime.base import BaseObject
 from sktime.forecasting.base import BaseForecaster
-from sktime.utils._testing.hierarchical import _make_hierarchical
 from sktime.utils._testing.panel import _make_panel_X
 from sktime.utils._testing.scenarios import TestScenario
 from sktime.utils._testing.series import _make_series
@@ -29,7 +29,58 @@ from sktime.utils._testing.series import _make_series
 RAND_SEED = 42
 
 
+# data for scenarios is generated on first use, not on import
+@lru_cache(maxsize=None)
+def _get_y(n_columns=1):
+    return _make_series(n_timepoints=20, n_columns=n_columns, random_state=RAND_SEED)
+
+
+@lru_cache(maxsize=None)
+def _get_long_X():
+    return _make_series(n_columns=2, n_timepoints=30, random_state=RAND_SEED)
+
+
+def _get_X():
+    return _get_long_X().iloc[0:20]
+
+
+def _get_X_test():
+    return _get_long_X().iloc[20:23]
+
+
+def _get_X_test_short():
+    return _get_long_X().iloc[20:21]
+
+
+@lru_cache(maxsize=None)
+def _get_y_panel():
+    return _make_panel_X(
+        n_instances=3, n_timepoints=10, n_columns=1, random_state=RAND_SEED
+    )
+
+
 class ForecasterTestScenario(TestScenario, BaseObject):
+    @property
+    def args(self):
+        """Return args of the scenario, generated by _make_args on first access."""
+        if not hasattr(self, "_args"):
+            self._args = self._make_args()
+        return self._args
+
+    @args.setter
+    def args(self, value):
+        self._args = value
+
+    @classmethod
+    def _make_args(cls):
+        """Construct args of the scenario. Should be overridden in child classes.
+
+        Returns
+        -------
+        args : dict of dict, argument dicts for methods, keyed by method key
+        """
+        raise NotImplementedError("abstract method")
+
     def is_applicable(self, obj):
         """Check whether scenario is applicable to obj.
 
@@ -105,56 +156,47 @@ class ForecasterFitPredictUnivariateNoX(ForecasterTestScenario):
 
     _tags = {"univariate_y": True, "fh_passed_in_fit": True, "is_enabled": False}
 
-    args = {
-        "fit": {"y": _make_series(n_timepoints=20, random_state=RAND_SEED), "fh": 1},
-        "predict": {"fh": 1},
-    }
     default_method_sequence = ["fit", "predict"]
 
+    @classmethod
+    def _make_args(cls):
+        return {"fit": {"y": _get_y().copy(), "fh": 1}, "predict": {"fh": 1}}
+
 
 class ForecasterFitPredictUnivariateNoXEarlyFh(ForecasterTestScenario):
     """Fit/predict only, univariate y, no X, fh passed late in predict."""
 
     _tags = {"univariate_y": True, "fh_passed_in_fit": True}
 
-    args = {
-        "fit": {"y": _make_series(n_timepoints=20, random_state=RAND_SEED), "fh": 1},
-        "predict": {},
-    }
     default_method_sequence = ["fit", "predict"]
 
+    @classmethod
+    def _make_args(cls):
+        return {"fit": {"y": _get_y().copy(), "fh": 1}, "predict": {}}
+
 
 class ForecasterFitPredictUnivariateNoXLateFh(ForecasterTestScenario):
     """Fit/predict only, univariate y, no X, fh passed late in predict."""
 
     _tags = {"univariate_y": True, "fh_passed_in_fit": False}
 
-    args = {
-        "fit": {"y": _make_series(n_timepoints=20, random_state=RAND_SEED)},
-        "predict": {"fh": 1},
-    }
     default_method_sequence = ["fit", "predict"]
 
+    @classmethod
+    def _make_args(cls):
+        return {"fit": {"y": _get_y().copy()}, "predict": {"fh": 1}}
+
 
 class ForecasterFitPredictUnivariateNoXLongFh(ForecasterTestScenario):
     """Fit/predict only, univariate y, no X, longer fh, passed early in fit."""
 
     _tags = {"univariate_y": True, "fh_passed_in_fit": True, "is_enabled": True}
 
-    args = {
-        "fit": {
-            "y": _make_series(n_timepoints=20, random_state=RAND_SEED),
-            "fh": [1, 2, 3],
-        },
-        "predict": {},
-    }
     default_method_sequence = ["fit", "predict"]
 
-
-LONG_X = _make_series(n_columns=2, n_timepoints=30, random_state=RAND_SEED)
-X = LONG_X.iloc[0:20]
-X_test = LONG_X.iloc[20:23]
-X_test_short = LONG_X.iloc[20:21]
+    @classmethod
+    def _make_args(cls):
+        return {"fit": {"y": _get_y().copy(), "fh": [1, 2, 3]}, "predict": {}}
 
 
 class ForecasterFitPredictUnivariateWithX(ForecasterTestScenario):
@@ -162,67 +204,60 @@ class ForecasterFitPredictUnivariateWithX(ForecasterTestScenario):
 
     _tags = {"univariate_y": True, "fh_passed_in_fit": True, "is_enabled": True}
 
-    args = {
-        "fit": {
-            "y": pd.DataFrame(_make_series(n_timepoints=20, random_state=RAND_SEED)),
-            "X": X.copy(),
-            "fh": 1,
-        },
-        "predict": {"X": X_test_short.copy()},
-    }
     default_method_sequence = ["fit", "predict"]
 
+    @classmethod
+    def _make_args(cls):
+        return {
+            "fit": {"y": pd.DataFrame(_get_y().copy()), "X": _get_X().copy(), "fh": 1},
+            "predict": {"X": _get_X_test_short().copy()},
+        }
+
 
 class ForecasterFitPredictUnivariateWithXLongFh(ForecasterTestScenario):
     """Fit/predict only, univariate y, with X, and longer fh, passed early in fit."""
 
     _tags = {"univariate_y": True, "fh_passed_in_fit": True}
 
-    args = {
-        "fit": {
-            "y": _make_series(n_timepoints=20, random_state=RAND_SEED),
-            "X": X.copy(),
-            "fh": [1, 2, 3],
-        },
-        "predict": {"X": X_test.copy()},
-    }
     default_method_sequence = ["fit", "predict"]
 
+    @classmethod
+    def _make_args(cls):
+        return {
+            "fit": {"y": _get_y().copy(), "X": _get_X().copy(), "fh": [1, 2, 3]},
+            "predict": {"X": _get_X_test().copy()},
+        }
+
 
 class ForecasterFitPredictMultivariateNoX(ForecasterTestScenario):
     """Fit/predict only, multivariate y, no X, fh passed early in fit."""
 
     _tags = {"univariate_y": False, "fh_passed_in_fit": True, "is_enabled": True}
 
-    args = {
-        "fit": {
-            "y": _make_series(n_timepoints=20, n_columns=2, random_state=RAND_SEED),
-            "fh": 1,
-        },
-        "predict": {},
-    }
     default_method_sequence = ["fit", "predict"]
 
+    @classmethod
+    def _make_args(cls):
+        return {"fit": {"y": _get_y(n_columns=2).copy(), "fh": 1}, "predict": {}}
+
 
 class ForecasterFitPredictMultivariateWithX(ForecasterTestScenario):
     """Fit/predict only, multivariate y, with X, and longer fh, passed early in fit."""
 
     _tags = {"univariate_y": False, "fh_passed_in_fit": True}
 
-    args = {
-        "fit": {
-            "y": _make_series(n_timepoints=20, n_columns=2, random_state=RAND_SEED),
-            "X": X.copy(),
-            "fh": [1, 2, 3],
-        },
-        "predict": {"X": X_test.copy()},
-    }
     default_method_sequence = ["fit", "predict"]
 
-
-y_panel = _make_panel_X(
-    n_instances=3, n_timepoints=10, n_columns=1, random_state=RAND_SEED
-)
+    @classmethod
+    def _make_args(cls):
+        return {
+            "fit": {
+                "y": _get_y(n_columns=2).copy(),
+                "X": _get_X().copy(),
+                "fh": [1, 2, 3],
+            },
+            "predict": {"X": _get_X_test().copy()},
+        }
 
 
 class ForecasterFitPredictPanelSimple(ForecasterTestScenario):
@@ -230,11 +265,11 @@ class ForecasterFitPredictPanelSimple(ForecasterTestScenario):
 
     _tags = {"univariate_y": True, "fh_passed_in_fit": True}
 
-    args = {"fit": {"y": y_panel.copy(), "fh": [1, 2, 3]}, "predict": {}}
     default_method_sequence = ["fit", "predict"]
 
-
-y_hierarchical = _make_hierarchical(n_columns=1, random_state=RAND_SEED)
+    @classmethod
+    def _make_args(cls):
+        return {"fit": {"y": _get_y_panel().copy(), "fh": [1, 2, 3]}, "predict": {}}
 
 
 class ForecasterFitPredictHierarchicalSimple(ForecasterTestScenario):
@@ -242,9 +277,12 @@ class ForecasterFitPredictHierarchicalSimple(ForecasterTestScenario):
 
     _tags = {"univariate_y": True, "fh_passed_in_fit": True}
 
-    args = {"fit": {"y": y_panel.copy(), "fh": [1, 2, 3]}, "predict": {}}
     default_method_sequence = ["fit", "predict"]
 
+    @classmethod
+    def _make_args(cls):
+        return {"fit": {"y": _get_y_panel().copy(), "fh": [1, 2, 3]}, "predict": {}}
+
 
 forecasting_scenarios_simple = [
     ForecasterFitPredictUnivariateNoX,